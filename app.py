@@ -1,19 +1,35 @@
 # [file name]: app.py
 
 import streamlit as st
-import json
+import array
+import collections
+import html
+import io
 import time
-import os
 import datetime
-import tempfile
-from models.interview_model import InterviewModel
-from utils.audio_utils import AudioHandler
-from utils.evaluation_utils import EvaluationReport
+import string
+import sys
+import threading
+import numpy as np
+
+# How long a results render waits on the background PDF before rerunning
+_PDF_POLL_SECONDS = 0.5
 
 class InterviewBot:
     def __init__(self):
-        self.model = InterviewModel()
+        # Deferred so Streamlit can paint before the NLP and audio stacks load
+        from utils.audio_utils import AudioHandler
+        
+        # The model loads in the background while the welcome screen is shown
+        self._model = None
+        self._model_error = None
+        self._model_ready = threading.Event()
+        threading.Thread(target=self._load_model, daemon=True).start()
+        
         self.audio_handler = AudioHandler()
+        self._pdf_lock = threading.Lock()
+        self._used_indices = set()
+        self._upcoming = None  # next question, picked early so its audio can be prerendered
         self.session_data = {
             'questions': [],
             'current_question_index': 0,
@@ -26,6 +42,32 @@ class InterviewBot:
             'last_spoken_question': None
         }
     
+    def _load_model(self):
+        try:
+            from models.interview_model import InterviewModel
+            self._model = InterviewModel()
+            # The question bank is lazy; load it here too so it is warm before the first question
+            self._model.questions
+        except Exception as e:
+            print(f"Error loading interview model: {e}")
+            self._model_error = e
+        finally:
+            self._model_ready.set()
+    
+    def is_model_ready(self):
+        return self._model_ready.is_set()
+    
+    def wait_for_model(self, timeout=None):
+        return self._model_ready.wait(timeout=timeout)
+    
+    @property
+    def model(self):
+        """The InterviewModel, blocking until the background load has finished"""
+        self.wait_for_model()
+        if self._model_error is not None:
+            raise self._model_error
+        return self._model
+    
     def initialize_session(self, question_limit):
         session_id = f"INT-{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.session_data = {
@@ -35,10 +77,16 @@ class InterviewBot:
             'session_active': True,
             'session_id': session_id,
             'start_time': time.time(),
+            'start_monotonic': time.monotonic(),
             'end_time': None,
             'auto_speak': True,
-            'last_spoken_question': None
+            'last_spoken_question': None,
+            # Column-wise companions to 'questions', filled in by submit_answer
+            '_scores': array.array('d'),
+            '_category_scores': collections.defaultdict(list)
         }
+        self._used_indices = set()
+        self._upcoming = None
         
         # Start continuous listening if audio is available
         if self.audio_handler.is_audio_available():
@@ -50,8 +98,8 @@ class InterviewBot:
         if len(self.session_data['questions']) >= self.session_data['question_limit']:
             return None
         
-        used_questions = [q['question'] for q in self.session_data['questions']]
-        question = self.model.get_question(used_questions)
+        question = self._upcoming or self.model.get_question(used_indices=self._used_indices)
+        self._upcoming = None
         
         if question:
             question_data = {
@@ -65,106 +113,234 @@ class InterviewBot:
                 'ideal_answer': question.get('ideal_answer', '')
             }
             self.session_data['questions'].append(question_data)
+            self._used_indices.add(question['_index'])
+            # Pick the following question now so its audio can be rendered during this answer
+            if len(self.session_data['questions']) < self.session_data['question_limit']:
+                self._upcoming = self.model.get_question(used_indices=self._used_indices)
             return question_data
         return None
     
+    def prewarm_upcoming(self):
+        """Have the TTS process render the next question once the queued speech is done"""
+        if self._upcoming is not None and self.audio_handler.is_audio_available():
+            self.audio_handler.prewarm_phrases([self._upcoming['question']])
+    
     def submit_answer(self, answer):
         if self.session_data['questions']:
             current_question = self.session_data['questions'][-1]
             current_question['user_answer'] = answer
-            current_question['evaluation'] = self.model.evaluate_answer(
-                current_question, answer
-            )
+            # Scored together with the other answers in evaluate_pending_answers
+            current_question['evaluation'] = None
+    
+    def evaluate_pending_answers(self):
+        """Score every unevaluated answer with a single batched model call"""
+        pending = [q for q in self.session_data['questions'] if q['evaluation'] is None]
+        if not pending:
+            return
+        
+        # Repeated answers are served from the model's own evaluation caches
+        results = self.model.evaluate_answers([(q, q['user_answer']) for q in pending])
+        for q, evaluation in zip(pending, results):
+            q['evaluation'] = evaluation
+        
+        for q in pending:
+            score = q['evaluation']['score']
+            self.session_data['_scores'].append(score)
+            self.session_data['_category_scores'][q['category']].append(score)
     
     def end_session(self):
         self.session_data['session_active'] = False
         self.session_data['end_time'] = time.time()
+        self.session_data['duration_s'] = time.monotonic() - self.session_data['start_monotonic']
+        self.session_data['end_time_iso'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self.audio_handler.stop_continuous_listening()
         self.audio_handler.stop_all_speech()
+        # Scoring and the PDF are left to show_results, which runs them behind a spinner
+    
+    def start_pdf_report(self):
+        """Build the PDF off the render path, once per session; show_results picks up the bytes when ready"""
+        if '_pdf_ready' in self.session_data:
+            return
+        self.session_data['_pdf_ready'] = threading.Event()
+        threading.Thread(target=self._build_pdf, args=(self.session_data,), daemon=True).start()
+    
+    def _build_pdf(self, session_data):
+        """Render the PDF report into session_data['pdf_bytes'] (b'' on failure)"""
+        pdf_data = b''
+        try:
+            from utils.evaluation_utils import EvaluationReport
+            
+            buffer = io.BytesIO()
+            if EvaluationReport(session_data).generate_pdf_report(buffer):
+                pdf_data = buffer.getvalue()
+        except Exception as e:
+            print(f"PDF generation failed: {e}")
+        finally:
+            with self._pdf_lock:
+                session_data['pdf_bytes'] = pdf_data
+            session_data['_pdf_ready'].set()
+
+_REPORT_CSS = """
+    body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+    .header { background: #2c3e50; color: white; padding: 30px; border-radius: 10px; }
+    .score { font-size: 3em; color: #3498db; font-weight: bold; }
+    .question { margin: 20px 0; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }
+    .good { border-left: 5px solid #27ae60; }
+    .average { border-left: 5px solid #f39c12; }
+    .poor { border-left: 5px solid #e74c3c; }
+    .keyword { display: inline-block; background: #ecf0f1; padding: 5px 10px; margin: 2px; border-radius: 3px; }
+    .matched { background: #d4edda; color: #155724; }
+    .missing { background: #f8d7da; color: #721c24; }
+    .ideal-answer { background: #e3f2fd; padding: 15px; border-radius: 8px; margin: 10px 0; }
+"""
+
+_escape = html.escape
+_KW_MATCHED = '<span class="keyword matched">{}</span>'.format
+_KW_MISSING = '<span class="keyword missing">{}</span>'.format
+
+# Templates are parsed once at import; each report only substitutes values.
+# Static markup is kept pre-encoded since the report is served as UTF-8 bytes.
+_REPORT_TITLE_TMPL = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>AI Interview Report - $session_id</title>
+""")
+
+_REPORT_STYLE = f"""    <style>{_REPORT_CSS}</style>
+</head>
+<body>
+""".encode('utf-8')
+
+_REPORT_SUMMARY_TMPL = string.Template("""    <div class="header">
+        <h1>🤖 AI Interview Performance Report</h1>
+        <p>Session ID: $session_id | Date: $report_date</p>
+    </div>
+    
+    <div style="text-align: center; margin: 40px 0;">
+        <div class="score">$overall_score/10</div>
+        <h2>Performance Level: $performance_level</h2>
+        <p>Total Questions: $total_questions | Duration: $duration</p>
+    </div>
+    
+    <h2>Detailed Analysis</h2>
+""")
+
+_REPORT_FOOTER = """
+    <div style="margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
+        <h3>📊 Performance Insights</h3>
+        <p>This report was generated automatically by the AI Interview Bot. Keep practicing to improve your interview skills!</p>
+    </div>
+</body>
+</html>
+""".encode('utf-8')
+
+_QUESTION_HEADER_TMPL = string.Template("""
+<div class="question $rating_class">
+    <h3>Q$number: $question</h3>
+    <p><strong>Your Answer:</strong> $user_answer</p>
+    <p><strong>Score:</strong> $score/10</p>
+    <div>
+        <strong>Matched Keywords:</strong><br>""")
+
+_QUESTION_MISSING = """
+    </div>
+    <div>
+        <strong>Missing Keywords:</strong><br>""".encode('utf-8')
+
+_QUESTION_FOOTER_TMPL = string.Template("""
+    </div>
+    <div class="ideal-answer">
+        <strong>💡 Model Answer:</strong><br>$ideal_answer
+    </div>
+</div>
+""")
 
 def generate_html_report(session_data):
-    """Generate simple HTML report"""
+    """Generate simple HTML report as UTF-8 encoded bytes"""
     try:
-        stats = calculate_session_stats(session_data)
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>AI Interview Report - {session_data.get('session_id', 'N/A')}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-                .header {{ background: #2c3e50; color: white; padding: 30px; border-radius: 10px; }}
-                .score {{ font-size: 3em; color: #3498db; font-weight: bold; }}
-                .question {{ margin: 20px 0; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }}
-                .good {{ border-left: 5px solid #27ae60; }}
-                .average {{ border-left: 5px solid #f39c12; }}
-                .poor {{ border-left: 5px solid #e74c3c; }}
-                .keyword {{ display: inline-block; background: #ecf0f1; padding: 5px 10px; margin: 2px; border-radius: 3px; }}
-                .matched {{ background: #d4edda; color: #155724; }}
-                .missing {{ background: #f8d7da; color: #721c24; }}
-                .ideal-answer {{ background: #e3f2fd; padding: 15px; border-radius: 8px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🤖 AI Interview Performance Report</h1>
-                <p>Session ID: {session_data.get('session_id', 'N/A')} | Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            
-            <div style="text-align: center; margin: 40px 0;">
-                <div class="score">{stats.get('overall_score', 0)}/10</div>
-                <h2>Performance Level: {stats.get('performance_level', 'N/A')}</h2>
-                <p>Total Questions: {stats.get('total_questions', 0)} | Duration: {stats.get('duration_formatted', 'N/A')}</p>
-            </div>
-            
-            <h2>Detailed Analysis</h2>
-            {"".join([create_question_html(q, i) for i, q in enumerate(session_data.get('questions', []))])}
-            
-            <div style="margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
-                <h3>📊 Performance Insights</h3>
-                <p>This report was generated automatically by the AI Interview Bot. Keep practicing to improve your interview skills!</p>
-            </div>
-        </body>
-        </html>
-        """
-        return html_content
+        return _cached_html_report(_session_key(session_data), session_data)
     except Exception as e:
-        return f"<html><body><h1>Error generating report: {e}</h1></body></html>"
+        return f"<html><body><h1>Error generating report: {e}</h1></body></html>".encode('utf-8')
+
+def _session_key(session_data):
+    """Hashable digest of the parts of session_data a report depends on"""
+    return (session_data.get('session_id'),
+            len(session_data.get('questions', [])),
+            session_data.get('end_time'))
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_html_report(session_key, _session_data):
+    # The leading underscore tells Streamlit not to hash the mutable session dict
+    report = bytearray()
+    for chunk in _emit_report(_session_data):
+        report.extend(chunk)
+    return bytes(report)
 
-def create_question_html(question_data, index):
-    """Create HTML for a single question"""
-    eval_data = question_data.get('evaluation', {})
+def _emit_report(session_data):
+    """Yield the HTML report as UTF-8 chunks so it is assembled exactly once"""
+    stats = calculate_session_stats(session_data)
+    session_id = _escape(str(session_data.get('session_id', 'N/A')))
+    
+    yield _REPORT_TITLE_TMPL.substitute(session_id=session_id).encode('utf-8')
+    yield _REPORT_STYLE
+    yield _REPORT_SUMMARY_TMPL.substitute(
+        session_id=session_id,
+        report_date=session_data.get('end_time_iso', 'N/A'),
+        overall_score=stats.get('overall_score', 0),
+        performance_level=stats.get('performance_level', 'N/A'),
+        total_questions=stats.get('total_questions', 0),
+        duration=stats.get('duration_formatted', 'N/A')
+    ).encode('utf-8')
+    rating_classes = session_data.get('_rating_classes', ())
+    for i, q in enumerate(session_data.get('questions', [])):
+        rating_class = _RATING_CLASSES[rating_classes[i]] if i < len(rating_classes) else None
+        yield from _emit_question(q, i, rating_class)
+    yield _REPORT_FOOTER
+
+def _emit_question(question_data, index, rating_class=None):
+    """Yield the UTF-8 encoded HTML chunks for a single question"""
+    eval_data = question_data.get('evaluation') or {}
     score = eval_data.get('score', 0)
     
-    if score >= 7:
-        rating_class = "good"
-    elif score >= 5:
-        rating_class = "average"
-    else:
-        rating_class = "poor"
-    
-    matched_keywords = "".join([f'<span class="keyword matched">{kw}</span>' for kw in eval_data.get('matched_keywords', [])])
-    missing_keywords = "".join([f'<span class="keyword missing">{kw}</span>' for kw in eval_data.get('missing_keywords', [])])
+    if rating_class is None:
+        rating_class = _RATING_CLASSES[(score >= 5) + (score >= 7)]
     
+    matched = eval_data.get('matched_keywords', ())
+    missing = eval_data.get('missing_keywords', ())
     ideal_answer = eval_data.get('ideal_answer', question_data.get('ideal_answer', 'No model answer available.'))
     
-    return f"""
-    <div class="question {rating_class}">
-        <h3>Q{index + 1}: {question_data.get('question', 'N/A')}</h3>
-        <p><strong>Your Answer:</strong> {question_data.get('user_answer', 'No answer provided')}</p>
-        <p><strong>Score:</strong> {score}/10</p>
-        <div>
-            <strong>Matched Keywords:</strong><br>{matched_keywords if matched_keywords else 'None'}
-        </div>
-        <div>
-            <strong>Missing Keywords:</strong><br>{missing_keywords if missing_keywords else 'None'}
-        </div>
-        <div class="ideal-answer">
-            <strong>💡 Model Answer:</strong><br>{ideal_answer}
-        </div>
-    </div>
+    yield _QUESTION_HEADER_TMPL.substitute(
+        rating_class=rating_class,
+        number=index + 1,
+        question=_escape(question_data.get('question', 'N/A')),
+        user_answer=_escape(question_data.get('user_answer', 'No answer provided')),
+        score=score
+    ).encode('utf-8')
+    if matched:
+        yield ''.join(map(_KW_MATCHED, map(_escape, matched))).encode('utf-8')
+    else:
+        yield b'None'
+    yield _QUESTION_MISSING
+    if missing:
+        yield ''.join(map(_KW_MISSING, map(_escape, missing))).encode('utf-8')
+    else:
+        yield b'None'
+    yield _QUESTION_FOOTER_TMPL.substitute(ideal_answer=_escape(ideal_answer)).encode('utf-8')
+
+_PERFORMANCE_LEVELS = ("Needs Improvement", "Average", "Good", "Excellent")
+_RATING_CLASSES = ("poor", "average", "good")
+
+def _classify_scores(scores):
+    """Bucket a score array in one vectorized pass.
+    
+    Returns (overall score, index into _PERFORMANCE_LEVELS, per-question
+    indices into _RATING_CLASSES).
     """
+    overall = float(scores.mean()) if scores.size else 0.0
+    level = int(overall >= 4) + int(overall >= 6) + int(overall >= 8)
+    classes = (scores >= 5).astype(np.int8) + (scores >= 7).astype(np.int8)
+    return overall, level, classes
 
 def calculate_session_stats(session_data):
     """Calculate session statistics"""
@@ -172,37 +348,52 @@ def calculate_session_stats(session_data):
     if not questions:
         return {}
     
-    scores = [q.get('evaluation', {}).get('score', 0) for q in questions]
-    overall_score = sum(scores) / len(scores) if scores else 0
+    # Streamlit reruns this on every interaction; reuse stats until the session changes
+    cache_key = (len(questions), session_data.get('end_time'))
+    if session_data.get('_stats_cache_key') == cache_key:
+        return session_data['_stats_cache']
     
-    # Performance level
-    if overall_score >= 8:
-        performance_level = "Excellent"
-    elif overall_score >= 6:
-        performance_level = "Good"
-    elif overall_score >= 4:
-        performance_level = "Average"
+    scores = session_data.get('_scores')
+    if scores is not None and len(scores) == len(questions):
+        scores = np.frombuffer(scores, dtype=np.float64)
     else:
-        performance_level = "Needs Improvement"
+        # Some questions are unanswered (or data predates the score column)
+        scores = np.fromiter(((q.get('evaluation') or {}).get('score', 0) for q in questions),
+                             dtype=np.float64, count=len(questions))
+    overall_score, level, classes = _classify_scores(scores)
+    performance_level = _PERFORMANCE_LEVELS[level]
     
     # Duration
-    duration = session_data.get('end_time', time.time()) - session_data.get('start_time', time.time())
+    if session_data.get('session_active'):
+        duration = time.monotonic() - session_data['start_monotonic']
+    else:
+        duration = session_data.get('duration_s', 0.0)
     minutes = int(duration // 60)
     seconds = int(duration % 60)
     duration_formatted = f"{minutes}:{seconds:02d}"
     
-    return {
+    stats = {
         'overall_score': round(overall_score, 2),
         'performance_level': performance_level,
         'total_questions': len(questions),
         'duration_formatted': duration_formatted
     }
+    session_data['_stats_cache_key'] = cache_key
+    session_data['_stats_cache'] = stats
+    session_data['_rating_classes'] = classes
+    return stats
+
+_DIRS_READY = False
 
 def ensure_directories():
-    """Ensure required directories exist"""
-    os.makedirs('models', exist_ok=True)
-    os.makedirs('utils', exist_ok=True)
-    os.makedirs('templates', exist_ok=True)
+    """Ensure required directories exist (once per process)"""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    import os
+    for directory in ('models', 'utils', 'templates'):
+        os.makedirs(directory, exist_ok=True)
+    _DIRS_READY = True
 
 def main():
     st.set_page_config(
@@ -376,6 +567,9 @@ def conduct_enhanced_interview(bot):
                         bot.session_data['questions'][-1]['user_answer'])
     
     if need_new_question:
+        if not bot.is_model_ready():
+            with st.spinner("Loading interview questions..."):
+                bot.wait_for_model()
         next_question = bot.get_next_question()
         if not next_question:
             bot.end_session()
@@ -386,6 +580,8 @@ def conduct_enhanced_interview(bot):
             st.session_state.question_changed = True
             # Clear previous audio transcription
             st.session_state.audio_text = ""
+            # Widget key for this question's answer box, built once per question
+            bot.session_data['_answer_key'] = sys.intern(f"answer_{len(bot.session_data['questions'])}")
     
     current_question = bot.session_data['questions'][-1]
     
@@ -394,12 +590,13 @@ def conduct_enhanced_interview(bot):
         bot.session_data['auto_speak'] and 
         bot.audio_handler.is_audio_available()):
         
-        # Wait for any previous speech to complete
+        # Wait for any previous speech to complete (returns at once when idle)
         bot.audio_handler.wait_for_speech_completion(timeout=2)
-        time.sleep(0.5)  # Brief pause
         
         # Speak the question with priority
         bot.audio_handler.speak_text(current_question['question'], priority=True)
+        # Queued behind the question, so it never delays it
+        bot.prewarm_upcoming()
         bot.session_data['last_spoken_question'] = current_question['question']
         st.session_state.question_changed = False
         
@@ -456,7 +653,7 @@ def conduct_enhanced_interview(bot):
             st.warning("⚠️ Voice recording not active")
         
         # Real-time audio transcription display
-        audio_text = bot.audio_handler.get_audio_text()
+        audio_text = " ".join(bot.audio_handler.drain_audio_text())
         if audio_text:
             st.session_state.audio_text = audio_text
             st.success(f"🎯 **Captured:** {audio_text}")
@@ -506,7 +703,7 @@ def conduct_enhanced_interview(bot):
             "**Your Answer:**",
             placeholder="Type your answer here...\n\n💡 Provide detailed answers with relevant keywords for better scoring.",
             height=150,
-            key=f"answer_{len(bot.session_data['questions'])}"
+            key=bot.session_data['_answer_key']
         )
         
         if st.button("📤 Submit Answer", type="primary", use_container_width=True):
@@ -520,6 +717,14 @@ def conduct_enhanced_interview(bot):
 def show_results(bot):
     st.header("📊 Interview Results")
     
+    from utils.evaluation_utils import EvaluationReport
+    
+    if any(q['evaluation'] is None for q in bot.session_data['questions']):
+        with st.spinner("Scoring your answers..."):
+            bot.evaluate_pending_answers()
+    # The report needs the scores, so it starts only now
+    bot.start_pdf_report()
+    
     # Generate reports
     report = EvaluationReport(bot.session_data)
     stats = report.calculate_overall_stats()
@@ -555,17 +760,19 @@ def show_results(bot):
     st.subheader("🔍 Detailed Question Analysis")
     
     for i, q_data in enumerate(bot.session_data['questions'], 1):
-        with st.expander(f"Q{i}: {q_data['question']} (Score: {q_data['evaluation']['score']}/10)", expanded=(i==1)):
+        eval_data = q_data['evaluation']
+        with st.expander(f"Q{i}: {q_data['question']} (Score: {eval_data['score']}/10)", expanded=(i==1)):
             col1, col2 = st.columns([2, 1])
             
             with col1:
                 st.write(f"**Your Answer:** {q_data['user_answer']}")
                 
-                eval_data = q_data['evaluation']
                 st.write(f"**Keyword Score:** {eval_data['keyword_score']}/10")
                 st.write(f"**Sentiment Score:** {eval_data['sentiment_score']}/10")
                 st.write(f"**Completeness Score:** {eval_data['completeness_score']}/10")
                 st.write(f"**Fluency Score:** {eval_data['fluency_score']}/10")
+                if eval_data.get('semantic_score') is not None:
+                    st.write(f"**Semantic Score:** {eval_data['semantic_score']}/10")
                 
                 # Display model answer
                 st.markdown("---")
@@ -600,30 +807,23 @@ def show_results(bot):
         )
     
     with col2:
-        # PDF report
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                temp_pdf_path = tmp_file.name
-            
-            success = report.generate_pdf_report(temp_pdf_path)
-            
-            if success and os.path.exists(temp_pdf_path):
-                with open(temp_pdf_path, "rb") as f:
-                    pdf_data = f.read()
-                
-                os.unlink(temp_pdf_path)
-                
-                st.download_button(
-                    label="📊 Download PDF Report",
-                    data=pdf_data,
-                    file_name=f"interview_report_{bot.session_data.get('session_id', 'session')}.pdf",
-                    mime="application/pdf",
-                    use_container_width=True
-                )
-            else:
-                st.error("PDF generation failed")
-        except Exception as e:
-            st.error(f"PDF Error: {e}")
+        # PDF report (built in the background by start_pdf_report)
+        pdf_ready = bot.session_data.get('_pdf_ready')
+        with bot._pdf_lock:
+            pdf_data = bot.session_data.get('pdf_bytes')
+        
+        if pdf_data is None:
+            st.info("⏳ Generating PDF...")
+        elif pdf_data:
+            st.download_button(
+                label="📊 Download PDF Report",
+                data=pdf_data,
+                file_name=f"interview_report_{bot.session_data.get('session_id', 'session')}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
+        else:
+            st.error("PDF generation failed")
     
     with col3:
         # HTML Report
@@ -657,6 +857,12 @@ def show_results(bot):
             st.session_state.auto_listening = False
             st.session_state.question_changed = False
             st.rerun()
+    
+    # Still building: poll with short reruns so clicks are handled between them,
+    # and the download button appears as soon as the bytes are in
+    if pdf_data is None and pdf_ready is not None:
+        pdf_ready.wait(timeout=_PDF_POLL_SECONDS)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
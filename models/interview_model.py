@@ -1,68 +1,250 @@
-import json
+import collections
+import functools
+import hashlib
+import orjson
 import random
 import re
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import sys
+import types
+from dataclasses import dataclass
+import numpy as np
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import string
 
-# Download required NLTK data
+# Semantic similarity scoring is optional; without it the original weights apply
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-except:
-    pass
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# English stopwords (same list as NLTK's corpus), kept inline to avoid the corpus download
+_STOPWORDS = frozenset("""
+a about above after again against ain all am an and any are aren aren't as at
+be because been before being below between both but by can couldn couldn't d did
+didn didn't do does doesn doesn't doing don don't down during each few for from
+further had hadn hadn't has hasn hasn't have haven haven't having he her here hers
+herself him himself his how i if in into is isn isn't it it's its itself just ll
+m ma me mightn mightn't more most mustn mustn't my myself needn needn't no nor not
+now o of off on once only or other our ours ourselves out over own re s same shan
+shan't she she's should should've shouldn shouldn't so some such t than that
+that'll the their theirs them themselves then there these they this those through
+to too under until up ve very was wasn wasn't we were weren weren't what when where
+which while who whom why will with won won't wouldn wouldn't y you you'd you'll
+you're you've your yours yourself yourselves
+""".split())
+
+_TOKEN_RE = re.compile(r"[A-Za-z']+")
+
+# Score buckets: a count below _TH[i] scores _SC[i]; at or above the last threshold scores _SC[-1]
+_WC_TH = np.array([10, 25, 50])
+_WC_SC = np.array([0.3, 0.6, 0.8, 1.0])
+_SL_TH = np.array([5, 10])
+_SL_SC = np.array([0.4, 0.7, 0.9])
+
+def question_digest(text):
+    """Compact 8-byte fingerprint of a question's text, used for used-question tracking"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+# Model answers for the built-in questions, built once at import and read-only
+_IDEAL_ANSWERS = types.MappingProxyType({sys.intern(k): v for k, v in {
+    "What is your experience with Python programming?": "I have 3+ years of professional experience with Python programming. I've worked on web development using Django and Flask, data analysis with Pandas and NumPy, and automation scripts. I'm proficient in object-oriented programming, REST API development, and have experience with popular Python libraries for machine learning and data visualization.",
+    
+    "Tell me about your problem-solving approach.": "My problem-solving approach is systematic: First, I thoroughly understand the problem and requirements. Then I break it down into smaller, manageable parts. I research potential solutions, evaluate the best approach, implement it, and test thoroughly. I believe in continuous improvement and always document my solutions for future reference.",
+    
+    "How do you handle tight deadlines?": "I handle tight deadlines through effective prioritization and time management. I break projects into smaller tasks with clear milestones, use project management tools to track progress, and maintain open communication with stakeholders about progress and potential challenges. I focus on delivering the most critical features first while maintaining quality standards.",
+    
+    "What database technologies are you familiar with?": "I'm experienced with both SQL and NoSQL databases. For SQL, I've worked extensively with MySQL and PostgreSQL, including database design, optimization, and complex queries. For NoSQL, I have experience with MongoDB for document storage and Redis for caching. I'm also familiar with ORM tools like SQLAlchemy and Django ORM.",
+    
+    "Describe a challenging project you worked on.": "One challenging project was developing a real-time analytics platform that processed large volumes of data. The main challenge was ensuring data consistency while maintaining performance. I implemented a distributed caching system, optimized database queries, and used asynchronous processing. The solution improved processing speed by 70% while maintaining data accuracy.",
+    
+    "What is your understanding of machine learning?": "Machine learning involves training algorithms to identify patterns in data and make predictions or decisions without being explicitly programmed. I understand supervised learning (classification, regression), unsupervised learning (clustering, dimensionality reduction), and reinforcement learning. I have practical experience with model training, evaluation metrics, and deployment using frameworks like Scikit-learn and TensorFlow.",
+    
+    "How do you stay updated with new technologies?": "I stay updated through multiple channels: I follow tech blogs and newsletters, participate in online courses on platforms like Coursera, attend webinars and tech meetups, contribute to open-source projects, and regularly practice coding challenges. I also experiment with new technologies through personal projects to gain hands-on experience.",
+    
+    "Explain REST API principles.": "REST API principles include: 1) Statelessness - each request contains all necessary information, 2) Client-Server architecture - separation of concerns, 3) Cacheability - responses can be cached, 4) Uniform interface - consistent resource identification and manipulation, 5) Layered system - architecture can have multiple layers. REST APIs use standard HTTP methods (GET, POST, PUT, DELETE) and typically return data in JSON format.",
+    
+    "What is your greatest strength?": "My greatest strength is my ability to quickly learn and adapt to new technologies and environments. I'm also strong in analytical thinking and problem-solving, which allows me to break down complex problems and develop effective solutions. Additionally, I have excellent communication skills that help me collaborate effectively with team members and stakeholders.",
+    
+    "How do you handle constructive criticism?": "I view constructive criticism as valuable feedback for growth. I listen actively without being defensive, ask clarifying questions to fully understand the feedback, reflect on how I can improve, and create a concrete action plan. I believe continuous learning and improvement are essential for professional development and always appreciate feedback that helps me grow."
+}.items()})
+
+_DEFAULT_IDEAL_ANSWER = "A good answer should address all aspects of the question, provide specific examples where relevant, and demonstrate both knowledge and practical experience in the subject matter."
+
+def _reference_text(record):
+    """Text an answer is compared with for semantic scoring.
+    
+    The record's own ``answer`` if it has one, else a question-specific ideal
+    answer, else '' -- the generic default says nothing about the topic.
+    """
+    ideal = record.get('ideal_answer')
+    return record.get('answer') or (ideal if ideal and ideal != _DEFAULT_IDEAL_ANSWER else '')
+
+@functools.lru_cache(maxsize=1024)
+def keyword_pattern(expected_keywords):
+    """Compile one regex finding every (lowercased) keyword as a whole word.
+    
+    Each keyword gets its own optional capture inside a lookahead, so keywords
+    that overlap or nest ('machine', 'machine learning') are all reported by a
+    single scan. Read the hits with `m.groups()` from `finditer`.
+    """
+    if not expected_keywords:
+        return None
+    alternatives = [re.escape(kw) for kw in dict.fromkeys(k.lower() for k in expected_keywords)]
+    # (?<!\w) / (?!\w) rather than \b, so keywords ending in symbols ('c++') still match
+    anchor = r'(?<!\w)(?=(?:' + '|'.join(alternatives) + r')(?!\w))'
+    return re.compile(anchor + ''.join(r'(?=(?:(' + kw + r')(?!\w))?)' for kw in alternatives))
+
+_VADER = SentimentIntensityAnalyzer()
+
+@functools.lru_cache(maxsize=1024)
+def _sentiment_cached(text):
+    """Sentiment in [0, 1] for an answer text; resubmitted answers hit the cache"""
+    return (_VADER.polarity_scores(text)['compound'] + 1) / 2
+
+# Dict-style key -> Question attribute, for callers written against the JSONL records
+_QUESTION_KEYS = {
+    'question': 'question',
+    'category': 'category',
+    'expected_keywords': 'expected_keywords',
+    'ideal_answer': 'ideal_answer',
+    '_index': 'index',
+    '_digest': 'digest',
+    '_reference': 'reference',
+    '_kw_re': 'kw_re',
+    '_ideal_emb': 'ideal_emb',
+}
+
+@dataclass(slots=True)
+class Question:
+    """A question-bank record with its load-time precomputed fields.
+    
+    Supports read-only dict-style access (``q['question']``, ``q.get(...)``,
+    ``'_kw_re' in q``) so it can be used wherever a question dict is expected.
+    """
+    question: str
+    category: str
+    expected_keywords: tuple
+    ideal_answer: str
+    reference: str = ''
+    index: int = -1
+    digest: bytes = b''
+    kw_re: 're.Pattern | None' = None
+    ideal_emb: 'np.ndarray | None' = None
+    
+    @classmethod
+    def from_record(cls, record, index):
+        kws = tuple(record.get('expected_keywords', ()))
+        return cls(
+            question=sys.intern(record['question']),
+            category=record['category'],
+            expected_keywords=kws,
+            ideal_answer=record['ideal_answer'],
+            reference=_reference_text(record),
+            index=index,
+            digest=question_digest(record['question']),
+            kw_re=keyword_pattern(kws)
+        )
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, _QUESTION_KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        attr = _QUESTION_KEYS.get(key)
+        return getattr(self, attr) if attr is not None else default
+    
+    def __contains__(self, key):
+        attr = _QUESTION_KEYS.get(key)
+        return attr is not None and getattr(self, attr) is not None
 
 class InterviewModel:
+    EVAL_CACHE_SIZE = 512
+    SEMANTIC_HIT_THRESHOLD = 0.95
+    
     def __init__(self):
-        self.questions = self.load_questions()
-        self.stop_words = set(stopwords.words('english'))
+        self._enc = self.load_encoder()
+        self._ideal_embs = {}
+        # (question, normalized answer) -> (answer embedding or None, evaluation), LRU order
+        self._eval_cache = collections.OrderedDict()
+        self._rng = random.Random()
+        self.stop_words = _STOPWORDS
+        self._sent_split = re.compile(r'[.!?]+\s+')
+    
+    @functools.cached_property
+    def questions(self):
+        """Question bank, read from database.jsonl on first access"""
+        return self.load_questions()
+    
+    def load_encoder(self):
+        """Load the sentence embedding model, or None if it is unavailable"""
+        if SentenceTransformer is None:
+            return None
+        try:
+            return SentenceTransformer(_EMBEDDING_MODEL)
+        except Exception as e:
+            print(f"Semantic scoring disabled: {e}")
+            return None
+    
+    def encode(self, text):
+        """L2-normalized float32 embedding of text"""
+        return self._enc.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    def ideal_embedding(self, question):
+        """Embedding of a question's reference answer, computed once per question; None if it has none"""
+        if '_ideal_emb' in question:
+            return question['_ideal_emb']
+        # Plain dicts copied from bank questions (the app's session records) find the load-time vectors here
+        key = question_digest(question['question'])
+        emb = self._ideal_embs.get(key)
+        if emb is None:
+            text = question.reference if isinstance(question, Question) else _reference_text(question)
+            if not text:
+                return None
+            emb = self._ideal_embs[key] = self.encode(text)
+        return emb
     
     def load_questions(self):
+        """Read the question bank into Question records"""
         questions = []
         try:
-            with open('database.jsonl', 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        question_data = json.loads(line)
-                        # Ensure ideal_answer is included from database
-                        if 'ideal_answer' not in question_data:
-                            question_data['ideal_answer'] = self.get_ideal_answer(question_data['question'])
-                        questions.append(question_data)
+            with open('database.jsonl', 'rb') as f:
+                for raw in f:
+                    if not raw.strip():
+                        continue
+                    question_data = orjson.loads(raw)
+                    # Ensure ideal_answer is included from database
+                    if 'ideal_answer' not in question_data:
+                        question_data['ideal_answer'] = self.get_ideal_answer(question_data['question'])
+                    questions.append(question_data)
         except FileNotFoundError:
             # Create default questions if file doesn't exist
             questions = self.create_default_questions()
         except Exception as e:
             print(f"Error loading questions: {e}")
             questions = self.create_default_questions()
+        
+        questions = [Question.from_record(record, i) for i, record in enumerate(questions)]
+        
+        # Each distinct reference text once, in bank order
+        texts = list(dict.fromkeys(q.reference for q in questions if q.reference))
+        if self._enc is not None and texts:
+            # One batched forward pass for the whole bank instead of one encode per question
+            embs = self._enc.encode(texts, batch_size=32,
+                                    normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+            by_text = dict(zip(texts, embs))
+            for q in questions:
+                if q.reference:
+                    q.ideal_emb = by_text[q.reference]
+                    self._ideal_embs[q.digest] = q.ideal_emb
         return questions
     
     def get_ideal_answer(self, question):
         """Get ideal answer for a question based on the question content"""
-        ideal_answers = {
-            "What is your experience with Python programming?": "I have 3+ years of professional experience with Python programming. I've worked on web development using Django and Flask, data analysis with Pandas and NumPy, and automation scripts. I'm proficient in object-oriented programming, REST API development, and have experience with popular Python libraries for machine learning and data visualization.",
-            
-            "Tell me about your problem-solving approach.": "My problem-solving approach is systematic: First, I thoroughly understand the problem and requirements. Then I break it down into smaller, manageable parts. I research potential solutions, evaluate the best approach, implement it, and test thoroughly. I believe in continuous improvement and always document my solutions for future reference.",
-            
-            "How do you handle tight deadlines?": "I handle tight deadlines through effective prioritization and time management. I break projects into smaller tasks with clear milestones, use project management tools to track progress, and maintain open communication with stakeholders about progress and potential challenges. I focus on delivering the most critical features first while maintaining quality standards.",
-            
-            "What database technologies are you familiar with?": "I'm experienced with both SQL and NoSQL databases. For SQL, I've worked extensively with MySQL and PostgreSQL, including database design, optimization, and complex queries. For NoSQL, I have experience with MongoDB for document storage and Redis for caching. I'm also familiar with ORM tools like SQLAlchemy and Django ORM.",
-            
-            "Describe a challenging project you worked on.": "One challenging project was developing a real-time analytics platform that processed large volumes of data. The main challenge was ensuring data consistency while maintaining performance. I implemented a distributed caching system, optimized database queries, and used asynchronous processing. The solution improved processing speed by 70% while maintaining data accuracy.",
-            
-            "What is your understanding of machine learning?": "Machine learning involves training algorithms to identify patterns in data and make predictions or decisions without being explicitly programmed. I understand supervised learning (classification, regression), unsupervised learning (clustering, dimensionality reduction), and reinforcement learning. I have practical experience with model training, evaluation metrics, and deployment using frameworks like Scikit-learn and TensorFlow.",
-            
-            "How do you stay updated with new technologies?": "I stay updated through multiple channels: I follow tech blogs and newsletters, participate in online courses on platforms like Coursera, attend webinars and tech meetups, contribute to open-source projects, and regularly practice coding challenges. I also experiment with new technologies through personal projects to gain hands-on experience.",
-            
-            "Explain REST API principles.": "REST API principles include: 1) Statelessness - each request contains all necessary information, 2) Client-Server architecture - separation of concerns, 3) Cacheability - responses can be cached, 4) Uniform interface - consistent resource identification and manipulation, 5) Layered system - architecture can have multiple layers. REST APIs use standard HTTP methods (GET, POST, PUT, DELETE) and typically return data in JSON format.",
-            
-            "What is your greatest strength?": "My greatest strength is my ability to quickly learn and adapt to new technologies and environments. I'm also strong in analytical thinking and problem-solving, which allows me to break down complex problems and develop effective solutions. Additionally, I have excellent communication skills that help me collaborate effectively with team members and stakeholders.",
-            
-            "How do you handle constructive criticism?": "I view constructive criticism as valuable feedback for growth. I listen actively without being defensive, ask clarifying questions to fully understand the feedback, reflect on how I can improve, and create a concrete action plan. I believe continuous learning and improvement are essential for professional development and always appreciate feedback that helps me grow."
-        }
-        return ideal_answers.get(question, "A good answer should address all aspects of the question, provide specific examples where relevant, and demonstrate both knowledge and practical experience in the subject matter.")
+        return _IDEAL_ANSWERS.get(question, _DEFAULT_IDEAL_ANSWER)
     
     def create_default_questions(self):
         """Create default questions if database file doesn't exist"""
@@ -89,92 +271,261 @@ class InterviewModel:
         
         # Save default questions to file WITH ideal_answer
         try:
-            with open('database.jsonl', 'w', encoding='utf-8') as f:
-                for q in default_questions:
-                    # Include ideal_answer in the saved data
-                    f.write(json.dumps(q) + '\n')
+            with open('database.jsonl', 'wb') as f:
+                # Include ideal_answer in the saved data
+                f.writelines(orjson.dumps(q) + b'\n' for q in default_questions)
         except Exception as e:
             print(f"Warning: Could not create database file: {e}")
             
         return default_questions
     
-    def get_question(self, used_questions=None):
-        if used_questions is None:
-            used_questions = []
+    def get_question(self, used_questions=None, used_indices=None):
+        """Pick a random unused question.
         
-        available_questions = [q for q in self.questions if q['question'] not in used_questions]
+        Used questions are given as bank indices (``used_indices``, the
+        ``'_index'`` of each returned question); ``used_questions``, a collection
+        of question texts, is still accepted for older callers.
+        """
+        if used_indices is not None:
+            is_used = lambda q: q.index in used_indices
+        elif used_questions:
+            is_used = lambda q: q.question in used_questions
+        else:
+            return self._rng.choice(self.questions)
         
-        if not available_questions:
-            # If all questions used, start over
-            available_questions = self.questions
+        # Reservoir sampling (k=1): uniform over the unused questions without building a list
+        pick = None
+        seen = 0
+        for q in self.questions:
+            if is_used(q):
+                continue
+            seen += 1
+            if self._rng.randrange(seen) == 0:
+                pick = q
         
-        return random.choice(available_questions)
+        # If all questions used, start over
+        return pick if pick is not None else self._rng.choice(self.questions)
     
     def evaluate_answer(self, question, user_answer):
         if not user_answer:
             return self.create_empty_evaluation()
         
-        # Simple keyword matching evaluation
+        # Derived views of the answer, computed once and shared by every sub-scorer
+        views = self._analyze(user_answer)
+        
+        # Level 1: exact (normalized) repeat of an earlier answer to this question
+        key = self._cache_key(question, views[0])
+        cached = self._exact_lookup(key)
+        if cached is not None:
+            return cached
+        
+        # Level 2: near-duplicate answer to the same question by embedding similarity
+        answer_emb = None
+        if self._enc is not None:
+            try:
+                answer_emb = self.encode(user_answer)
+            except Exception as e:
+                print(f"Semantic scoring failed: {e}")
+        if answer_emb is not None:
+            hit = self._semantic_lookup(question['question'], answer_emb)
+            if hit is not None:
+                return dict(hit)
+        
+        evaluation = self._score_answer(question, user_answer, views, answer_emb)
+        self._remember(key, answer_emb, evaluation)
+        return dict(evaluation)
+    
+    def evaluate_answers(self, pairs):
+        """Evaluate a batch of (question, user_answer) pairs, returning evaluations in order.
+        
+        Answers are embedded in one encoder call, semantic similarities come from a
+        single row-wise dot product, and the length buckets are looked up over whole
+        arrays; only keyword matching and sentiment run per answer.
+        """
+        results = [None] * len(pairs)
+        todo = []
+        for i, (question, user_answer) in enumerate(pairs):
+            if not user_answer:
+                results[i] = self.create_empty_evaluation()
+                continue
+            views = self._analyze(user_answer)
+            key = self._cache_key(question, views[0])
+            cached = self._exact_lookup(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                todo.append((i, question, user_answer, key, views))
+        if not todo:
+            return results
+        
+        answer_embs = None
+        if self._enc is not None:
+            try:
+                answer_embs = self._enc.encode([a for _, _, a, _, _ in todo], batch_size=32,
+                                               normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+            except Exception as e:
+                print(f"Semantic scoring failed: {e}")
+        
+        if answer_embs is not None:
+            remaining = []
+            for j, (i, question, *_) in enumerate(todo):
+                hit = self._semantic_lookup(question['question'], answer_embs[j])
+                if hit is not None:
+                    results[i] = dict(hit)
+                else:
+                    remaining.append(j)
+            todo = [todo[j] for j in remaining]
+            answer_embs = answer_embs[remaining]
+            if not todo:
+                return results
+        
+        n = len(todo)
+        word_counts = np.fromiter((t[4][1] for t in todo), dtype=np.int32, count=n)
+        sent_counts = np.fromiter((t[4][2] for t in todo), dtype=np.int32, count=n)
+        completeness = _WC_SC[np.searchsorted(_WC_TH, word_counts, side='right')]
+        fluency = _SL_SC[np.searchsorted(_SL_TH, word_counts / sent_counts, side='right')]
+        
+        # Only questions with a reference answer get a semantic term
+        semantic = [None] * n
+        if answer_embs is not None:
+            ideal_embs = [self.ideal_embedding(q) for _, q, *_ in todo]
+            rows = [j for j, emb in enumerate(ideal_embs) if emb is not None]
+            if rows:
+                sims = np.maximum(0.0, (answer_embs[rows] * np.vstack([ideal_embs[j] for j in rows])).sum(axis=1))
+                for j, sim in zip(rows, sims.tolist()):
+                    semantic[j] = sim
+        
+        for j, (i, question, user_answer, key, (lower, _, _)) in enumerate(todo):
+            matched, missing, keyword_score = self._match_keywords(question, lower)
+            evaluation = self._build_evaluation(
+                question, matched, missing, keyword_score,
+                self._sentiment(user_answer), float(completeness[j]), float(fluency[j]),
+                semantic[j], int(word_counts[j])
+            )
+            self._remember(key, answer_embs[j] if answer_embs is not None else None, evaluation)
+            results[i] = dict(evaluation)
+        return results
+    
+    def _analyze(self, user_answer):
+        """Return (lowercased text, word count, sentence count) for an answer"""
+        lower = user_answer.lower()
+        word_count = len(_TOKEN_RE.findall(lower))
+        sent_count = max(1, sum(1 for s in self._sent_split.split(user_answer) if s.strip()))
+        return lower, word_count, sent_count
+    
+    def _cache_key(self, question, lower):
+        return (question['question'], lower.strip())
+    
+    def _exact_lookup(self, key):
+        cached = self._eval_cache.get(key)
+        if cached is None:
+            return None
+        self._eval_cache.move_to_end(key)
+        return dict(cached[1])
+    
+    def _remember(self, key, answer_emb, evaluation):
+        self._eval_cache[key] = (answer_emb, evaluation)
+        if len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
+    
+    def _semantic_lookup(self, question_text, answer_emb):
+        """Return the cached evaluation of the most similar earlier answer, if close enough"""
+        candidates = [(k, emb) for k, (emb, _) in self._eval_cache.items()
+                      if k[0] == question_text and emb is not None]
+        if not candidates:
+            return None
+        
+        # Embeddings are L2-normalized, so inner product == cosine similarity
+        sims = np.vstack([emb for _, emb in candidates]) @ answer_emb
+        best = int(np.argmax(sims))
+        if sims[best] <= self.SEMANTIC_HIT_THRESHOLD:
+            return None
+        
+        k = candidates[best][0]
+        self._eval_cache.move_to_end(k)
+        return self._eval_cache[k][1]
+    
+    def _match_keywords(self, question, lower):
+        """Return (matched, missing, keyword score in [0, 1]) from one regex scan over the lowercased answer"""
         expected_keywords = question.get('expected_keywords', [])
-        user_answer_lower = user_answer.lower()
+        kw_re = question['_kw_re'] if '_kw_re' in question else keyword_pattern(tuple(expected_keywords))
+        found = {kw for m in kw_re.finditer(lower) for kw in m.groups() if kw} if kw_re else set()
         
-        # Count matching keywords
-        matched_keywords = [kw for kw in expected_keywords if kw in user_answer_lower]
+        # Partition keywords into matched/missing in a single pass
+        matched_keywords = []
+        missing_keywords = []
+        add_matched, add_missing = matched_keywords.append, missing_keywords.append
+        for kw in expected_keywords:
+            (add_matched if kw.lower() in found else add_missing)(kw)
         keyword_score = len(matched_keywords) / len(expected_keywords) if expected_keywords else 0
-        
-        # Sentiment analysis using TextBlob
+        return matched_keywords, missing_keywords, keyword_score
+    
+    def _sentiment(self, user_answer):
+        """VADER compound polarity mapped from [-1, 1] to [0, 1]"""
         try:
-            sentiment = TextBlob(user_answer).sentiment
-            sentiment_score = (sentiment.polarity + 1) / 2  # Convert from [-1,1] to [0,1]
+            return _sentiment_cached(user_answer)
         except:
-            sentiment_score = 0.5
+            return 0.5
+    
+    def _score_answer(self, question, user_answer, views=None, answer_emb=None):
+        """Run the full scoring pipeline for one non-empty answer"""
+        lower, word_count, sent_count = views or self._analyze(user_answer)
+        matched_keywords, missing_keywords, keyword_score = self._match_keywords(question, lower)
+        sentiment_score = self._sentiment(user_answer)
         
         # Answer completeness (length check)
-        word_count = len(user_answer.split())
-        if word_count < 10:
-            completeness_score = 0.3
-        elif word_count < 25:
-            completeness_score = 0.6
-        elif word_count < 50:
-            completeness_score = 0.8
-        else:
-            completeness_score = 1.0
+        completeness_score = float(_WC_SC[np.searchsorted(_WC_TH, word_count, side='right')])
         
-        # Grammar and fluency (simple check)
-        try:
-            blob = TextBlob(user_answer)
-            # Simple fluency measure based on sentence count and length
-            sentences = blob.sentences
-            if len(sentences) > 0:
-                avg_sentence_length = sum(len(sentence.words) for sentence in sentences) / len(sentences)
-                if avg_sentence_length < 5:
-                    fluency_score = 0.4
-                elif avg_sentence_length < 10:
-                    fluency_score = 0.7
-                else:
-                    fluency_score = 0.9
-            else:
-                fluency_score = 0.5
-        except:
-            fluency_score = 0.5
+        # Grammar and fluency (simple measure based on average sentence length)
+        avg_sentence_length = word_count / sent_count
+        fluency_score = float(_SL_SC[np.searchsorted(_SL_TH, avg_sentence_length, side='right')])
+        
+        # Semantic similarity to the reference answer (catches paraphrased keywords)
+        semantic_score = None
+        if self._enc is not None:
+            try:
+                ideal_emb = self.ideal_embedding(question)
+                if ideal_emb is not None:
+                    if answer_emb is None:
+                        answer_emb = self.encode(user_answer)
+                    semantic_score = max(0.0, float(np.dot(answer_emb, ideal_emb)))
+            except Exception as e:
+                print(f"Semantic scoring failed: {e}")
         
+        return self._build_evaluation(question, matched_keywords, missing_keywords, keyword_score,
+                                      sentiment_score, completeness_score, fluency_score,
+                                      semantic_score, word_count)
+    
+    def _build_evaluation(self, question, matched_keywords, missing_keywords, keyword_score,
+                          sentiment_score, completeness_score, fluency_score, semantic_score, word_count):
+        """Combine the sub-scores (each in [0, 1]) into an evaluation dict"""
         # Overall score (weighted average)
-        overall_score = (
-            keyword_score * 0.4 +
-            sentiment_score * 0.2 +
-            completeness_score * 0.2 +
-            fluency_score * 0.2
-        ) * 10
+        if semantic_score is None:
+            overall_score = (
+                keyword_score * 0.4 +
+                sentiment_score * 0.2 +
+                completeness_score * 0.2 +
+                fluency_score * 0.2
+            ) * 10
+        else:
+            overall_score = (
+                keyword_score * 0.25 +
+                semantic_score * 0.25 +
+                sentiment_score * 0.15 +
+                completeness_score * 0.15 +
+                fluency_score * 0.2
+            ) * 10
         
         # Include the ideal answer from the question data in the evaluation
         return {
             'score': round(overall_score, 2),
             'matched_keywords': matched_keywords,
-            'missing_keywords': [kw for kw in expected_keywords if kw not in user_answer_lower],
+            'missing_keywords': missing_keywords,
             'keyword_score': round(keyword_score * 10, 2),
             'sentiment_score': round(sentiment_score * 10, 2),
             'completeness_score': round(completeness_score * 10, 2),
             'fluency_score': round(fluency_score * 10, 2),
+            'semantic_score': round(semantic_score * 10, 2) if semantic_score is not None else None,
             'word_count': word_count,
             'ideal_answer': question.get('ideal_answer', 'No model answer available.')  # Add this line
         }
@@ -189,6 +540,7 @@ class InterviewModel:
             'sentiment_score': 0.0,
             'completeness_score': 0.0,
             'fluency_score': 0.0,
+            'semantic_score': None,
             'word_count': 0,
             'ideal_answer': 'No model answer available.'
         }
\ No newline at end of file
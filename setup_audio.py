@@ -4,6 +4,7 @@ import os
 import sys
 import subprocess
 import platform
+from importlib.util import find_spec
 
 def check_system_requirements():
     """Check system requirements for audio functionality"""
@@ -13,15 +14,19 @@ def check_system_requirements():
     print(f"Operating System: {system}")
     print(f"Python Version: {sys.version}")
     
-    # Check for required packages
-    required_packages = ['pyaudio', 'speechrecognition', 'pyttsx3']
+    # Check for required packages (pip name -> import name); find_spec only
+    # locates the module, so no audio driver is initialized by the check
+    required_packages = {
+        'pyaudio': 'pyaudio',
+        'speechrecognition': 'speech_recognition',
+        'pyttsx3': 'pyttsx3'
+    }
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
+    for package, module in required_packages.items():
+        if find_spec(module) is not None:
             print(f"✅ {package} is installed")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package} is missing")
     
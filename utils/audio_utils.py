@@ -2,24 +2,296 @@
 import speech_recognition as sr
 import pyttsx3
 import threading
-import queue
 import time
+import multiprocessing as mp
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 import pyaudio
 import platform
+import collections
+import functools
+import hashlib
+import json
+import os
+import re
+import wave
+from pathlib import Path
+import numpy as np
+
+# Optional offline recognizer; without it recognition goes through Google's web API
+try:
+    from vosk import KaldiRecognizer, Model as VoskModel, SetLogLevel
+except ImportError:
+    KaldiRecognizer = VoskModel = None
+
+# Optional WebRTC voice activity detector; without it frames are gated on energy alone
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Online recognition languages, tried concurrently
+_GOOGLE_LANGUAGES = ('en-US', 'en-IN')
+
+_VOSK_MODEL_PATH = os.getenv("VOSK_MODEL", "models/vosk-model-small-en-us-0.15")
+
+# Device and voice name preferences, each matched with a single regex search per name
+_MIC_RE = re.compile(r'microphone|mic|input|default|primary', re.I)
+_VOICE_RE = re.compile(r'female|zira|karen|veena', re.I)
+_CACHED_VOICE_ID = None  # voice chosen on first TTS start, reused on relaunch
+
+# Continuous listening keeps at most this much audio; the decoder rechecks at least this often
+_RING_SECONDS = 30
+_DECODE_INTERVAL = 1.0
+_FRAME_SECONDS = 0.03   # energy is measured over 30 ms frames
+_PREROLL_SECONDS = 0.3  # audio kept ahead of detected speech
+_INT16_SCALE = np.float32(1 / 32768)
+
+# Synthesized prompts are kept here, keyed by voice settings and text
+_TTS_CACHE_DIR = Path("~/.cache/ai_interview_tts").expanduser()
+# Bounds for the cache; least recently played files are pruned first
+_TTS_CACHE_MAX_FILES = 200
+_TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_TTS_START_TIMEOUT = 15
+# Prewarmed phrases up to this length are also pinned in memory (newest _PREWARM_PINNED kept)
+_PREWARM_MAX_CHARS = 120
+_PREWARM_PINNED = 16
+_TEST_PHRASE = "Audio test one two three. System is working."
+
+@functools.lru_cache(maxsize=32)
+def _load_wav(path):
+    """Read a cached WAV into memory as (sample width, channels, rate, frames)"""
+    with wave.open(path, 'rb') as wf:
+        return wf.getsampwidth(), wf.getnchannels(), wf.getframerate(), wf.readframes(wf.getnframes())
+
+def _prune_tts_cache():
+    """Delete the least recently used cached WAVs until the cache is within its bounds"""
+    entries = []
+    for path in _TTS_CACHE_DIR.glob('*.wav'):
+        if path.name.endswith('.tmp.wav'):
+            continue  # still being written
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    
+    entries.sort()
+    count = len(entries)
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if count <= _TTS_CACHE_MAX_FILES and total <= _TTS_CACHE_MAX_BYTES:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        count -= 1
+        total -= size
+
+@functools.lru_cache(maxsize=1)
+def _cached_mic_names():
+    """PortAudio input device names, enumerated once per process (see refresh_devices)"""
+    return tuple(sr.Microphone.list_microphone_names())
+
+class _TTSRenderer:
+    """pyttsx3 engine plus the on-disk WAV cache; lives in the TTS child process"""
+    
+    def __init__(self, voice_id=None):
+        self.engine = pyttsx3.init()
+        self._pyaudio = None
+        self._pcm_cache = {}  # text -> decoded WAV for prewarmed phrases
+        
+        self.voice_id = voice_id if voice_id is not None else self._pick_voice()
+        if self.voice_id is not None:
+            self.engine.setProperty('voice', self.voice_id)
+        
+        # Enhanced TTS settings
+        self.engine.setProperty('rate', 170)  # Optimal speaking rate
+        self.engine.setProperty('volume', 0.9)  # Maximum volume
+        
+        # Try to set pitch if available
+        try:
+            self.engine.setProperty('pitch', 110)  # Slightly higher pitch for clarity
+        except:
+            pass  # Pitch not supported by all engines
+        
+        # Settings that change the synthesized audio, used in the TTS cache key
+        self.settings = (
+            self.engine.getProperty('voice'),
+            self.engine.getProperty('rate'),
+            self.engine.getProperty('volume'),
+        )
+    
+    def _pick_voice(self):
+        voices = self.engine.getProperty('voices')
+        if not voices:
+            return None
+        
+        # Prefer female voices for better clarity
+        preferred = next((voice for voice in voices if _VOICE_RE.search(voice.name)), None)
+        if preferred is not None:
+            print(f"✅ Using preferred voice: {preferred.name}")
+        else:
+            preferred = voices[0]
+            print(f"✅ Using default voice: {preferred.name}")
+        return preferred.id
+    
+    def prewarm(self, phrases):
+        """Render phrases ahead of time; short ones also keep their PCM in memory"""
+        for text in phrases:
+            if not text or text in self._pcm_cache:
+                continue
+            try:
+                path = self._render(text)
+                if path is None or len(text) > _PREWARM_MAX_CHARS:
+                    continue
+                self._pcm_cache[text] = _load_wav(str(path))
+                if len(self._pcm_cache) > _PREWARM_PINNED:
+                    del self._pcm_cache[next(iter(self._pcm_cache))]
+            except (OSError, wave.Error) as e:
+                print(f"TTS prewarm failed: {e}")
+    
+    def speak(self, text):
+        pcm = self._pcm_cache.get(text)
+        if pcm is not None:
+            # Prewarmed: straight to the output stream, no synthesis or disk access
+            self._play_pcm(*pcm)
+        # Play a cached rendering if possible, otherwise speak directly
+        elif not self._speak_cached(text):
+            self.engine.say(text)
+            self.engine.runAndWait()
+        
+        # Small delay to ensure clean transition
+        time.sleep(0.1)
+        return True
+    
+    def _cache_path(self, text):
+        voice_id, rate, volume = self.settings
+        key = hashlib.sha1(f"{voice_id}|{rate}|{volume}|{text}".encode('utf-8')).hexdigest()
+        return _TTS_CACHE_DIR / f"{key}.wav"
+    
+    def _speak_cached(self, text):
+        """Play text from the on-disk WAV cache, synthesizing it on a miss.
+        
+        Returns False when the engine cannot render to file, so the caller can
+        fall back to speaking directly.
+        """
+        try:
+            path = self._render(text)
+        except OSError as e:
+            print(f"TTS cache write failed: {e}")
+            return False
+        if path is None:
+            return False
+        
+        try:
+            self._play_pcm(*_load_wav(str(path)))
+            return True
+        except (OSError, wave.Error) as e:
+            print(f"Cached speech playback failed: {e}")
+            return False
+    
+    def _render(self, text):
+        """Path of the cached WAV for text, synthesizing it first if needed (None if unsupported)"""
+        path = self._cache_path(text)
+        if path.exists():
+            # Hit: mark as recently used so pruning keeps it
+            os.utime(path)
+            return path
+        
+        _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.wav")
+        self.engine.save_to_file(text, str(tmp))
+        self.engine.runAndWait()
+        if not tmp.exists() or tmp.stat().st_size == 0:
+            return None
+        os.replace(tmp, path)
+        _prune_tts_cache()
+        return path
+    
+    def _play_pcm(self, width, channels, rate, frames):
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+        stream = self._pyaudio.open(format=self._pyaudio.get_format_from_width(width),
+                                    channels=channels, rate=rate, output=True)
+        try:
+            stream.write(frames)
+        finally:
+            stream.stop_stream()
+            stream.close()
+
+def _tts_worker(cmds, results, voice_id):
+    """TTS child process: speak each text from `cmds` and acknowledge it on `results`"""
+    try:
+        renderer = _TTSRenderer(voice_id)
+    except Exception as e:
+        results.put(('error', str(e)))
+        return
+    results.put(('ready', renderer.voice_id))
+    
+    for text in iter(cmds.get, None):
+        if isinstance(text, tuple):
+            # ('prewarm', phrases): nothing to acknowledge
+            renderer.prewarm(text[1])
+            continue
+        try:
+            ok = renderer.speak(text)
+        except Exception as e:
+            print(f"Speech synthesis failed: {e}")
+            ok = False
+            # A wedged run loop only clears with a fresh engine
+            try:
+                renderer = _TTSRenderer(renderer.voice_id)
+            except Exception as reinit_error:
+                print(f"TTS reinitialization failed: {reinit_error}")
+                return
+        results.put(('done', ok))
 
 class AudioHandler:
-    def __init__(self):
+    def __init__(self, sample_rate=16000, chunk_size=None):
         self.recognizer = sr.Recognizer()
         self.microphone = None
-        self.tts_engine = None
-        self.audio_queue = queue.Queue()
+        self._mic_ctx = None  # open microphone source, shared across listen calls
+        # Capture at the recognizer's native rate; chunk size is tunable per device
+        self.mic_rate = sample_rate
+        self.mic_chunk = int(chunk_size or os.getenv("MIC_CHUNK", 512))
+        self.ambient_threshold = 300
+        self.vad = (webrtcvad.Vad(2) if webrtcvad is not None
+                    and self.mic_rate in (8000, 16000, 32000, 48000) else None)
+        # Rolling float32 capture buffer filled by the stream callback while listening
+        self.audio_buf = np.zeros(_RING_SECONDS * self.mic_rate, dtype=np.float32)
+        self.buf_len = 0
+        self._buf_lock = threading.Lock()
+        # Voice flags for the buffer's leading 30 ms frames, kept across decoder passes so
+        # each frame is classified once; _buf_gen bumps when the buffer shifts off-frame,
+        # _frames_shifted counts whole frames cut from its head
+        self._frame_len = int(self.mic_rate * _FRAME_SECONDS)
+        self._frame_flags = np.zeros(len(self.audio_buf) // self._frame_len + 1, dtype=bool)
+        self._n_classified = 0
+        self._buf_gen = 0
+        self._frames_shifted = 0
+        self._audio_ready = threading.Event()  # set by the stream callback on new samples
+        self._listen_stream = None
+        # Speech synthesis runs in a child process fed through these queues
+        self.tts_proc = None
+        self._tts_cmds = None
+        self._tts_results = None
+        self._vosk_model = None
+        self._asr_pool = None
+        self._pyaudio = None
+        # Single-producer/single-consumer rings; deque append/popleft are atomic
+        self.audio_queue = collections.deque(maxlen=128)
         self.is_listening = False
         self.is_speaking = False
-        self.speech_queue = queue.Queue()
+        self.speech_ring = collections.deque(maxlen=128)
+        self._speech_ready = threading.Event()
         self.speech_thread = None
-        self.stop_speech = False
-        self.speech_lock = threading.Lock()
+        # Set whenever no speech is queued or playing
+        self._speech_done = threading.Event()
+        self._speech_done.set()
+        self._speech_state_lock = threading.Lock()
         self.audio_available = False
         
         # Initialize audio components
@@ -30,10 +302,14 @@ class AudioHandler:
         try:
             # Initialize TTS
             self.initialize_tts()
+            self.prewarm_phrases([_TEST_PHRASE])
             
             # Initialize microphone
             self.initialize_microphone()
             
+            # Local recognizer is optional and never fatal
+            self.initialize_asr()
+            
             # Start speech processing thread
             self.start_speech_processor()
             
@@ -45,154 +321,209 @@ class AudioHandler:
             self.audio_available = False
     
     def initialize_tts(self):
-        """Initialize text-to-speech engine with enhanced settings"""
+        """Start the text-to-speech child process and wait for its engine to come up"""
+        global _CACHED_VOICE_ID
+        ctx = mp.get_context('spawn')
+        self._tts_cmds = ctx.Queue()
+        self._tts_results = ctx.Queue()
+        self.tts_proc = ctx.Process(target=_tts_worker, daemon=True,
+                                    args=(self._tts_cmds, self._tts_results, _CACHED_VOICE_ID))
+        self.tts_proc.start()
+        
         try:
-            self.tts_engine = pyttsx3.init()
-            
-            # Get available voices
-            voices = self.tts_engine.getProperty('voices')
-            
-            # Configure voice settings
-            if voices:
-                # Prefer female voices for better clarity
-                preferred_voices = [
-                    voice for voice in voices 
-                    if any(keyword in voice.name.lower() for keyword in ['female', 'zira', 'karen', 'veena'])
-                ]
-                
-                if preferred_voices:
-                    self.tts_engine.setProperty('voice', preferred_voices[0].id)
-                    print(f"✅ Using preferred voice: {preferred_voices[0].name}")
-                else:
-                    self.tts_engine.setProperty('voice', voices[0].id)
-                    print(f"✅ Using default voice: {voices[0].name}")
-            
-            # Enhanced TTS settings
-            self.tts_engine.setProperty('rate', 170)  # Optimal speaking rate
-            self.tts_engine.setProperty('volume', 0.9)  # Maximum volume
-            
-            # Try to set pitch if available
-            try:
-                self.tts_engine.setProperty('pitch', 110)  # Slightly higher pitch for clarity
-            except:
-                pass  # Pitch not supported by all engines
-            
-        except Exception as e:
-            print(f"❌ TTS initialization failed: {e}")
-            self.tts_engine = None
-            raise
+            status, value = self._tts_results.get(timeout=_TTS_START_TIMEOUT)
+        except queue.Empty:
+            status, value = 'error', "timed out waiting for the TTS engine"
+        if status != 'ready':
+            print(f"❌ TTS initialization failed: {value}")
+            self._stop_tts_process()
+            raise RuntimeError(value)
+        
+        # Relaunches skip voice enumeration
+        _CACHED_VOICE_ID = value
+    
+    def prewarm_phrases(self, phrases):
+        """Have the TTS process render phrases once the speech already queued has been spoken"""
+        if not self.tts_proc:
+            return False
+        # Shares the speech ring for ordering, but is not pending speech for wait_for_speech_completion
+        with self._speech_state_lock:
+            self.speech_ring.append(('prewarm', tuple(phrases)))
+            self._speech_ready.set()
+        return True
+    
+    def _stop_tts_process(self):
+        """Kill the TTS child process, cutting off any speech in progress"""
+        proc, self.tts_proc = self.tts_proc, None
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=1)
     
     def initialize_microphone(self):
         """Initialize microphone with enhanced settings"""
         try:
             # List available microphones
             print("🔍 Scanning for microphones...")
-            mic_list = sr.Microphone.list_microphone_names()
+            mic_list = _cached_mic_names()
             print(f"Found {len(mic_list)} microphone(s)")
             
             # Try to find the best microphone
-            best_mic_index = None
-            preferred_keywords = ['microphone', 'mic', 'input', 'default', 'primary']
-            
-            for i, name in enumerate(mic_list):
-                name_lower = name.lower()
-                if any(keyword in name_lower for keyword in preferred_keywords):
-                    best_mic_index = i
-                    print(f"✅ Selected microphone: {name}")
-                    break
-            
+            best_mic_index = next((i for i, name in enumerate(mic_list) if _MIC_RE.search(name)), None)
             if best_mic_index is not None:
-                self.microphone = sr.Microphone(device_index=best_mic_index)
+                print(f"✅ Selected microphone: {mic_list[best_mic_index]}")
             else:
-                self.microphone = sr.Microphone()
                 print("✅ Using default microphone")
+            self.microphone = sr.Microphone(device_index=best_mic_index,
+                                            sample_rate=self.mic_rate,
+                                            chunk_size=self.mic_chunk)
             
             # Enhanced noise adjustment
             print("🎙️ Calibrating microphone for ambient noise...")
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=2)
-                # Set optimal energy threshold
-                self.recognizer.energy_threshold = 300
-                self.recognizer.dynamic_energy_threshold = True
-                self.recognizer.pause_threshold = 0.8
+            source = self._open_mic()
+            # Energy threshold from one RMS over two seconds of room noise
+            rms = self._ambient_rms(source, duration=2)
+            self.ambient_threshold = max(300, rms * 1.5)
+            self.recognizer.energy_threshold = self.ambient_threshold
+            self.recognizer.dynamic_energy_threshold = True
+            self.recognizer.pause_threshold = 0.8
             
             print("✅ Microphone calibrated successfully")
             
         except Exception as e:
             print(f"❌ Microphone initialization failed: {e}")
+            self._close_mic()
             self.microphone = None
             raise
     
+    def initialize_asr(self):
+        """Load the local Vosk model if it is installed"""
+        if VoskModel is None or not os.path.isdir(_VOSK_MODEL_PATH):
+            return
+        try:
+            SetLogLevel(-1)
+            self._vosk_model = VoskModel(_VOSK_MODEL_PATH)
+            print("✅ Local speech recognition ready")
+        except Exception as e:
+            print(f"⚠️ Local speech recognition unavailable: {e}")
+            self._vosk_model = None
+    
+    def _recognize_local(self, audio):
+        """Transcribe captured audio with Vosk, feeding it 200 ms of PCM at a time"""
+        rec = KaldiRecognizer(self._vosk_model, self.mic_rate)
+        pcm = audio.get_raw_data(convert_rate=self.mic_rate, convert_width=2)
+        step = self.mic_rate // 5 * 2
+        for start in range(0, len(pcm), step):
+            rec.AcceptWaveform(pcm[start:start + step])
+        text = json.loads(rec.FinalResult()).get('text', '')
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
+    def refresh_devices(self):
+        """Forget the cached device list and pick a microphone again (e.g. after plugging one in)"""
+        _cached_mic_names.cache_clear()
+        self._close_mic()
+        self.initialize_microphone()
+    
+    def _open_mic(self):
+        """Open the microphone stream once and keep it open between listen calls"""
+        if self._mic_ctx is None:
+            self._mic_ctx = self.microphone.__enter__()
+        return self._mic_ctx
+    
+    def _close_mic(self):
+        if self._mic_ctx is None:
+            return
+        self._mic_ctx = None
+        try:
+            self.microphone.__exit__(None, None, None)
+        except Exception:
+            pass
+    
+    def _ambient_rms(self, source, duration):
+        """RMS of `duration` seconds of 16-bit audio read from an open microphone"""
+        raw = source.stream.read(int(source.SAMPLE_RATE * duration))
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+    
     def start_speech_processor(self):
         """Start dedicated thread for speech processing"""
         def speech_worker():
-            while not self.stop_speech:
-                try:
-                    text = self.speech_queue.get(timeout=1)
-                    if text is None:  # Stop signal
+            while True:
+                # Sleeps until speech is queued; stop_all_speech wakes it with a None sentinel
+                self._speech_ready.wait()
+                # Drain a batch of queued phrases per wake-up
+                for _ in range(16):
+                    try:
+                        text = self.speech_ring.popleft()
+                    except IndexError:
                         break
-                    self._speak_text_safe(text)
-                    self.speech_queue.task_done()
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    print(f"Speech worker error: {e}")
+                    if text is None:  # Stop signal
+                        # Release anyone waiting on speech cut off mid-phrase
+                        with self._speech_state_lock:
+                            self._speech_ready.clear()
+                            self._speech_done.set()
+                        return
+                    if isinstance(text, tuple):
+                        # ('prewarm', phrases): forwarded without waiting for the render
+                        if self.tts_proc and self.tts_proc.is_alive():
+                            self._tts_cmds.put(text)
+                        continue
+                    try:
+                        self._speak_text_safe(text)
+                    except Exception as e:
+                        print(f"Speech worker error: {e}")
+                self._mark_speech_done_if_idle()
         
         self.speech_thread = threading.Thread(target=speech_worker, daemon=True)
         self.speech_thread.start()
         print("✅ Speech processor started")
     
     def _speak_text_safe(self, text):
-        """Safely speak text with enhanced error handling"""
-        if not self.tts_engine or not text:
+        """Hand text to the TTS process and wait (on the speech thread) until it is spoken"""
+        if not self.tts_proc or not text:
             return False
-            
-        with self.speech_lock:
+        
+        if not self.tts_proc.is_alive():
+            # The engine process died: relaunch it instead of re-initializing in-process
+            print("⚠️ TTS process exited, restarting")
             try:
-                self.is_speaking = True
-                
-                # Stop any current speech
-                self.tts_engine.stop()
-                
-                # Speak new text
-                self.tts_engine.say(text)
-                self.tts_engine.runAndWait()
-                
-                # Small delay to ensure clean transition
-                time.sleep(0.1)
-                
-                return True
-                
-            except RuntimeError as e:
-                if "run loop already started" in str(e):
-                    # Handle TTS engine state issue
-                    try:
-                        self.tts_engine.endLoop()
-                    except:
-                        pass
-                    # Reinitialize TTS
-                    self.initialize_tts()
-                    return self._speak_text_safe(text)
-                else:
-                    print(f"TTS RuntimeError: {e}")
-                    return False
-                    
+                self.initialize_tts()
             except Exception as e:
-                print(f"Speech synthesis failed: {e}")
-                # Attempt to reinitialize TTS
-                try:
-                    self.tts_engine = None
-                    self.initialize_tts()
-                except Exception as reinit_error:
-                    print(f"TTS reinitialization failed: {reinit_error}")
+                print(f"TTS reinitialization failed: {e}")
                 return False
-                
-            finally:
-                self.is_speaking = False
+        
+        proc = self.tts_proc
+        self.is_speaking = True
+        try:
+            self._tts_cmds.put(text)
+            while True:
+                try:
+                    status, ok = self._tts_results.get(timeout=1)
+                except queue.Empty:
+                    if proc is not self.tts_proc or not proc.is_alive():
+                        return False
+                    continue
+                if status == 'done':
+                    return ok
+        finally:
+            self.is_speaking = False
+    
+    def _get_pyaudio(self):
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+        return self._pyaudio
+    
+    def _mark_speech_done_if_idle(self):
+        """Signal completion once nothing is left in the speech ring"""
+        with self._speech_state_lock:
+            if not self.speech_ring:
+                self._speech_ready.clear()
+                self._speech_done.set()
     
     def speak_text(self, text, priority=False):
         """Queue text for speech synthesis with optional priority"""
-        if not self.tts_engine or not text:
+        if not self.tts_proc or not text:
             return False
             
         try:
@@ -200,7 +531,10 @@ class AudioHandler:
                 # Clear queue for high-priority messages
                 self.clear_speech_queue()
             
-            self.speech_queue.put(text)
+            with self._speech_state_lock:
+                self._speech_done.clear()
+                self.speech_ring.append(text)
+                self._speech_ready.set()
             return True
             
         except Exception as e:
@@ -208,13 +542,12 @@ class AudioHandler:
             return False
     
     def clear_speech_queue(self):
-        """Clear all pending speech requests"""
-        while not self.speech_queue.empty():
-            try:
-                self.speech_queue.get_nowait()
-                self.speech_queue.task_done()
-            except queue.Empty:
-                break
+        """Clear all pending speech requests in one step, whatever the queue depth"""
+        with self._speech_state_lock:
+            self.speech_ring.clear()
+            if not self.is_speaking:
+                self._speech_ready.clear()
+                self._speech_done.set()
     
     def listen_for_speech(self, timeout=10, phrase_time_limit=8):
         """Listen for speech with enhanced recognition"""
@@ -223,28 +556,23 @@ class AudioHandler:
         
         try:
             print("🎤 Listening for speech...")
-            with self.microphone as source:
-                # Enhanced recognition settings
-                self.recognizer.energy_threshold = 300
-                self.recognizer.dynamic_energy_threshold = True
-                
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=timeout, 
-                    phrase_time_limit=phrase_time_limit
-                )
+            source = self._open_mic()
+            # Enhanced recognition settings
+            self.recognizer.energy_threshold = self.ambient_threshold
+            self.recognizer.dynamic_energy_threshold = True
             
-            print("🔍 Processing speech...")
+            audio = self.recognizer.listen(
+                source, 
+                timeout=timeout, 
+                phrase_time_limit=phrase_time_limit
+            )
             
-            # Try multiple recognition engines for better accuracy
-            try:
-                text = self.recognizer.recognize_google(audio, language='en-US')
-            except:
-                try:
-                    text = self.recognizer.recognize_google(audio, language='en-IN')
-                except:
-                    text = self.recognizer.recognize_google(audio)
+            # Skip the recognizer entirely for clips with no voiced frames
+            if self.vad is not None and not self._contains_speech(audio):
+                raise sr.UnknownValueError()
             
+            print("🔍 Processing speech...")
+            text = self._recognize(audio)
             print(f"✅ Recognized: {text}")
             return text.lower().strip()
             
@@ -261,26 +589,200 @@ class AudioHandler:
             print(f"⚠️ Unexpected error in speech recognition: {e}")
             return "error"
     
+    def _recognize(self, audio):
+        """Transcribe an AudioData clip; raises the speech_recognition errors on failure"""
+        if self._vosk_model is not None:
+            return self._recognize_local(audio)
+        
+        # Query each language at once and keep the first successful transcription
+        if self._asr_pool is None:
+            self._asr_pool = ThreadPoolExecutor(max_workers=len(_GOOGLE_LANGUAGES))
+        futures = [self._asr_pool.submit(self.recognizer.recognize_google, audio, language=lang)
+                   for lang in _GOOGLE_LANGUAGES]
+        errors = []
+        for future in as_completed(futures):
+            try:
+                return future.result()
+            except Exception as e:
+                errors.append(e)
+        
+        # "Not understood" wins over transport errors so callers report it as such
+        raise next((e for e in errors if isinstance(e, sr.UnknownValueError)), errors[-1])
+    
+    def _ring_append(self, samples, scale=np.float32(1)):
+        """Append samples * scale to the capture buffer, dropping the oldest audio when full.
+        
+        The scaled samples are written straight into the buffer, so no temporary
+        arrays are allocated.
+        """
+        n = len(samples)
+        cap = len(self.audio_buf)
+        with self._buf_lock:
+            if n >= cap:
+                np.multiply(samples[-cap:], scale, out=self.audio_buf, casting='unsafe')
+                self.buf_len = cap
+                self._reset_flags_locked()
+                return
+            if self.buf_len + n > cap:
+                # Drop whole frames, so the flags of the frames kept stay valid
+                over = self.buf_len + n - cap
+                self._commit_locked(-(-over // self._frame_len) * self._frame_len)
+            np.multiply(samples, scale, out=self.audio_buf[self.buf_len:self.buf_len + n], casting='unsafe')
+            self.buf_len += n
+    
+    def _ring_commit(self, n):
+        """Slice the first n samples (already decoded or discarded) off the buffer"""
+        with self._buf_lock:
+            self._commit_locked(n)
+    
+    def _commit_locked(self, n):
+        """_ring_commit body; the caller holds _buf_lock"""
+        n = min(n, self.buf_len)
+        self.buf_len -= n
+        self.audio_buf[:self.buf_len] = self.audio_buf[n:n + self.buf_len]
+        
+        # Frame-aligned cuts keep the remaining flags; anything else reclassifies
+        k, rem = divmod(n, self._frame_len)
+        if rem:
+            self._reset_flags_locked()
+        elif k:
+            keep = max(0, self._n_classified - k)
+            self._frame_flags[:keep] = self._frame_flags[k:k + keep]
+            self._n_classified = keep
+            self._frames_shifted += k
+    
+    def _reset_flags_locked(self):
+        self._n_classified = 0
+        self._buf_gen += 1
+    
+    def _voiced(self, frames):
+        """Per-frame speech flags for an (n, frame) float32 array"""
+        if self.vad is None:
+            # Frame RMS in int16 units, comparable with energy_threshold
+            return np.sqrt(np.mean(frames * frames, axis=1)) * 32768.0 > self.recognizer.energy_threshold
+        pcm = (np.clip(frames, -1.0, 1.0) * 32767).astype(np.int16)
+        return np.fromiter((self.vad.is_speech(row.tobytes(), self.mic_rate) for row in pcm),
+                           dtype=bool, count=len(pcm))
+    
+    def _contains_speech(self, audio):
+        """True if the VAD finds at least one voiced 30 ms frame in an AudioData clip"""
+        pcm = audio.get_raw_data(convert_rate=self.mic_rate, convert_width=2)
+        step = int(self.mic_rate * _FRAME_SECONDS) * 2
+        return any(self.vad.is_speech(pcm[i:i + step], self.mic_rate)
+                   for i in range(0, len(pcm) - step + 1, step))
+    
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback: append the int16 PCM to the buffer through a zero-copy view"""
+        self._ring_append(np.frombuffer(in_data, dtype=np.int16), _INT16_SCALE)
+        self._audio_ready.set()
+        return None, pyaudio.paContinue
+    
+    def _next_segment(self):
+        """Return the next finished utterance from the buffer, or None.
+        
+        An utterance is finished once it is followed by pause_threshold seconds of
+        unvoiced frames, or when the buffer is full. Stretches with no voiced frames
+        are discarded without ever reaching the recognizer.
+        """
+        frame = self._frame_len
+        preroll = int(self.mic_rate * _PREROLL_SECONDS) // frame * frame
+        
+        # Copy out only the frames that arrived since the last pass...
+        with self._buf_lock:
+            gen = self._buf_gen
+            base = self._frames_shifted
+            done = self._n_classified
+            n_frames = self.buf_len // frame
+            new = self.audio_buf[done * frame:n_frames * frame].copy()
+        
+        # ...and classify them without holding the lock, so the stream callback never waits on the VAD
+        flags = self._voiced(new.reshape(-1, frame)) if len(new) else None
+        
+        with self._buf_lock:
+            if gen != self._buf_gen:
+                return None  # the buffer shifted off-frame underneath us; reclassify next pass
+            # Whole frames cut meanwhile (overflow trimming) just move our frames towards the head
+            shift = self._frames_shifted - base
+            if flags is not None:
+                flags = flags[max(0, shift - done):]
+                lo = max(0, done - shift)
+                self._frame_flags[lo:lo + len(flags)] = flags
+                self._n_classified = lo + len(flags)
+            n_frames = max(0, n_frames - shift)
+            if n_frames == 0:
+                return None
+            
+            voiced = np.flatnonzero(self._frame_flags[:n_frames])
+            # Overflow trims whole frames, so a full buffer can be up to a frame short of capacity
+            full = self.buf_len > len(self.audio_buf) - frame
+            
+            if len(voiced) == 0:
+                drop = (n_frames * frame) - preroll
+                segment = None
+            else:
+                first, last = int(voiced[0]), int(voiced[-1])
+                trailing = (n_frames - 1 - last) * frame
+                if trailing < self.recognizer.pause_threshold * self.mic_rate and not full:
+                    return None  # still mid-utterance
+                start = max(0, first * frame - preroll)
+                drop = min(self.buf_len, (last + 1) * frame + preroll)
+                segment = self.audio_buf[start:drop].copy()
+            
+            # Commit in the same critical section, so no callback can shift the buffer in between
+            if drop > 0:
+                self._commit_locked(drop)
+        return segment
+    
+    def _transcribe(self, segment):
+        """Recognize a float32 segment from the capture buffer, returning None on failure"""
+        pcm = (np.clip(segment, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        try:
+            text = self._recognize(sr.AudioData(pcm, self.mic_rate, 2))
+        except (sr.UnknownValueError, sr.RequestError):
+            return None
+        return text.lower().strip() or None
+    
     def start_continuous_listening(self):
-        """Start continuous listening with enhanced settings"""
+        """Start continuous listening.
+        
+        A PyAudio callback streams microphone audio into the rolling buffer and wakes
+        a decoder thread, which transcribes finished utterances from it, so no audio
+        is lost between utterances.
+        """
         if not self.microphone:
             return False
         
+        try:
+            # The callback stream takes over the device from the shared source
+            self._close_mic()
+            self._ring_commit(self.buf_len)
+            self._listen_stream = self._get_pyaudio().open(
+                format=pyaudio.paInt16, channels=1, rate=self.mic_rate, input=True,
+                input_device_index=self.microphone.device_index,
+                frames_per_buffer=self.mic_chunk, stream_callback=self._on_audio
+            )
+        except Exception as e:
+            print(f"Error starting continuous listening: {e}")
+            return False
+        
         self.is_listening = True
         
-        def listen_loop():
+        def decode_loop():
             while self.is_listening:
+                self._audio_ready.wait(timeout=_DECODE_INTERVAL)
+                self._audio_ready.clear()
+                if not self.is_listening:
+                    break
                 try:
-                    result = self.listen_for_speech(timeout=5, phrase_time_limit=6)
-                    if result not in ["timeout", "unknown", "error"] and result:
-                        self.audio_queue.put(result)
-                    # Small delay to prevent CPU overload
-                    time.sleep(0.1)
+                    segment = self._next_segment()
+                    if segment is not None:
+                        text = self._transcribe(segment)
+                        if text:
+                            self.audio_queue.append(text)
                 except Exception as e:
                     print(f"Error in continuous listening: {e}")
-                    time.sleep(0.5)
         
-        thread = threading.Thread(target=listen_loop)
+        thread = threading.Thread(target=decode_loop)
         thread.daemon = True
         thread.start()
         print("✅ Continuous listening started")
@@ -289,20 +791,40 @@ class AudioHandler:
     def stop_continuous_listening(self):
         """Stop continuous listening"""
         self.is_listening = False
+        self._audio_ready.set()
+        stream, self._listen_stream = self._listen_stream, None
+        if stream is not None:
+            try:
+                stream.stop_stream()
+                stream.close()
+            except Exception:
+                pass
         print("✅ Continuous listening stopped")
     
     def get_audio_text(self):
         """Get transcribed text from audio queue"""
         try:
-            return self.audio_queue.get_nowait()
-        except queue.Empty:
+            return self.audio_queue.popleft()
+        except IndexError:
             return None
     
+    def drain_audio_text(self, limit=32):
+        """Pop up to `limit` pending transcriptions at once, oldest first"""
+        out = []
+        popleft = self.audio_queue.popleft
+        for _ in range(min(limit, len(self.audio_queue))):
+            try:
+                out.append(popleft())
+            except IndexError:
+                break
+        return out
+    
     def wait_for_speech_completion(self, timeout=10):
-        """Wait for all queued speech to complete"""
+        """Wait (up to timeout seconds) for all queued speech to complete"""
         try:
-            self.speech_queue.join()
-            return True
+            if self._speech_done.is_set():
+                return True
+            return self._speech_done.wait(timeout=timeout)
         except Exception as e:
             print(f"Error waiting for speech completion: {e}")
             return False
@@ -319,7 +841,7 @@ class AudioHandler:
         
         # Test TTS
         try:
-            if self.speak_text("Audio test one two three. System is working."):
+            if self.speak_text(_TEST_PHRASE):
                 time.sleep(2)  # Wait for speech to complete
                 results['tts'] = True
                 print("✅ TTS test passed")
@@ -347,16 +869,19 @@ class AudioHandler:
     
     def stop_all_speech(self):
         """Stop all speech and cleanup"""
-        self.stop_speech = True
         self.stop_continuous_listening()
+        self._close_mic()
         
-        if self.tts_engine:
-            try:
-                self.tts_engine.stop()
-            except:
-                pass
+        pool, self._asr_pool = self._asr_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        
+        self._stop_tts_process()
         
         self.clear_speech_queue()
+        with self._speech_state_lock:
+            self.speech_ring.append(None)  # Stop signal for the speech worker
+            self._speech_ready.set()
         print("✅ All audio stopped and cleaned up")
     
     def __del__(self):
@@ -18,14 +18,17 @@ class EvaluationReport:
             return self.get_empty_stats()
         
         scores = [q.get('evaluation', {}).get('score', 0) for q in questions]
-        categories = {}
         
-        for q in questions:
-            cat = q.get('category', 'general')
-            if cat not in categories:
-                categories[cat] = []
-            eval_data = q.get('evaluation', {})
-            categories[cat].append(eval_data.get('score', 0))
+        # Reuse the per-category columns kept by the bot when every question was scored
+        categories = self.session_data.get('_category_scores')
+        if categories is None or len(self.session_data.get('_scores', ())) != len(questions):
+            categories = {}
+            for q in questions:
+                cat = q.get('category', 'general')
+                if cat not in categories:
+                    categories[cat] = []
+                eval_data = q.get('evaluation', {})
+                categories[cat].append(eval_data.get('score', 0))
         
         category_scores = {cat: np.mean(scores) if scores else 0 for cat, scores in categories.items()}
         
@@ -34,9 +37,15 @@ class EvaluationReport:
             'total_questions': len(scores),
             'category_scores': category_scores,
             'performance_level': self.get_performance_level(np.mean(scores) if scores else 0),
-            'duration': self.session_data.get('end_time', 0) - self.session_data.get('start_time', 0)
+            'duration': self.get_duration()
         }
     
+    def get_duration(self):
+        """Session length in seconds, preferring the monotonic duration recorded at session end"""
+        if 'duration_s' in self.session_data:
+            return self.session_data['duration_s']
+        return (self.session_data.get('end_time') or 0) - (self.session_data.get('start_time') or 0)
+    
     def get_empty_stats(self):
         return {
             'overall_score': 0,
@@ -112,13 +121,19 @@ Category-wise Performance:
         return f"{minutes}:{seconds:02d}"
     
     def generate_pdf_report(self, filename):
-        """Generate PDF report with proper file handling"""
+        """Generate PDF report into a path or a writable file-like object (e.g. io.BytesIO)"""
+        temp_filename = None
         try:
-            # Create a temporary file first
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                temp_filename = tmp_file.name
+            if hasattr(filename, 'write'):
+                # In-memory target: ReportLab writes straight into the buffer
+                target = filename
+            else:
+                # Create a temporary file first
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+                    temp_filename = tmp_file.name
+                target = temp_filename
             
-            doc = SimpleDocTemplate(temp_filename, pagesize=letter)
+            doc = SimpleDocTemplate(target, pagesize=letter)
             styles = getSampleStyleSheet()
             story = []
             
@@ -171,16 +186,17 @@ Category-wise Performance:
             
             doc.build(story)
             
-            # Move the temporary file to the final destination
-            import shutil
-            shutil.move(temp_filename, filename)
+            if temp_filename is not None:
+                # Move the temporary file to the final destination
+                import shutil
+                shutil.move(temp_filename, filename)
             return True
             
         except Exception as e:
             print(f"PDF generation failed: {e}")
             # Clean up temporary file if it exists
             try:
-                if os.path.exists(temp_filename):
+                if temp_filename and os.path.exists(temp_filename):
                     os.unlink(temp_filename)
             except:
                 pass